@@ -29,8 +29,10 @@ DEALINGS IN THE SOFTWARE.
 import abc
 import json
 import sys
-import copy
+import types
 import asyncio
+import bisect
+import operator
 
 from .iterators import HistoryIterator
 from .context_managers import Typing
@@ -38,6 +40,7 @@ from .enums import try_enum, ChannelType, PermissionType
 from .errors import InvalidArgument, ClientException
 from .mentions import AllowedMentions
 from .permissions import PermissionOverwrite, Permissions
+from .flags import MessageFlags
 from .role import Role
 from .invite import Invite
 from .file import File
@@ -51,6 +54,64 @@ class _Undefined:
 
 _undefined = _Undefined()
 
+# the maximum amount of resolved permissions kept per channel
+_PERM_CACHE_SIZE = 512
+
+_ADMINISTRATOR = Permissions.administrator.flag
+_READ_MESSAGES = Permissions.read_messages.flag
+_SEND_MESSAGES = Permissions.send_messages.flag
+# the permissions that you can't have if you can't send messages
+_SEND_MESSAGES_DEPENDENT = (Permissions.send_tts_messages.flag | Permissions.mention_everyone.flag |
+                            Permissions.embed_links.flag | Permissions.attach_files.flag)
+_ALL_CHANNEL_PERMISSIONS = Permissions.all_channel().value
+
+_EPHEMERAL = MessageFlags.ephemeral.flag
+
+# an (allow, deny) pair that changes nothing
+_NO_OVERWRITE = (0, 0)
+
+# shared by the overwrite indexes of every channel without overwrites
+_EMPTY_INDEX = types.MappingProxyType({})
+_EMPTY_IDS = frozenset()
+
+# the GuildChannel attributes that are filled by _parse_overwrites
+_LAZY_OVERWRITE_ATTRS = frozenset(('_overwrites', '_role_ow_index', '_role_ow_ids', '_member_ow_index'))
+
+def _resolve_overwrites(value, everyone, role_overwrites, role_overwrite_ids, role_ids, member):
+    # The numeric core of GuildChannel.permissions_for.
+    # ``value`` is the permission value granted by the guild roles,
+    # ``everyone`` and ``member`` are (allow, deny) pairs, ``role_overwrites``
+    # maps role IDs to (allow, deny) pairs and ``role_overwrite_ids`` is a
+    # frozenset of its keys. Only ints are touched in here.
+
+    # Apply @everyone allow/deny first since it's special
+    value = (value & ~everyone[1]) | everyone[0]
+
+    # Apply channel specific role permission overwrites.
+    # Only the roles of the member that have an overwrite matter, the
+    # intersection finds them without a Python level lookup per role.
+    denies = 0
+    allows = 0
+    for role_id in role_overwrite_ids.intersection(role_ids):
+        overwrite = role_overwrites[role_id]
+        allows |= overwrite[0]
+        denies |= overwrite[1]
+
+    # Apply the role overwrites and then the member specific one in a single
+    # update, the member overwrite is applied last so it takes priority
+    value = ((value & ~denies | allows) & ~member[1]) | member[0]
+
+    # if you can't send a message in a channel then you can't have certain
+    # permissions as well
+    if not value & _SEND_MESSAGES:
+        value &= ~_SEND_MESSAGES_DEPENDENT
+
+    # if you can't read a channel then you have no permissions there
+    if not value & _READ_MESSAGES:
+        value &= ~_ALL_CHANNEL_PERMISSIONS
+
+    return value
+
 class Snowflake(metaclass=abc.ABCMeta):
     """An ABC that details the common operations on a Discord model.
 
@@ -169,21 +230,84 @@ class PrivateChannel(metaclass=abc.ABCMeta):
         return NotImplemented
 
 class _Overwrites:
-    __slots__ = ('id', 'allow', 'deny', 'type')
+    __slots__ = ('id', 'allow', 'deny', 'type', '_payload')
 
     def __init__(self, **kwargs):
         self.id = kwargs.pop('id')
         self.allow = int(kwargs.pop('allow_new', 0))
         self.deny = int(kwargs.pop('deny_new', 0))
         self.type = sys.intern(kwargs.pop('type'))
+        self._payload = None
 
     def _asdict(self):
-        return {
-            'id': self.id,
-            'allow': str(self.allow),
-            'deny': str(self.deny),
-            'type': self.type,
-        }
+        # overwrites are never mutated so the payload is built once
+        payload = self._payload
+        if payload is None:
+            payload = self._payload = {
+                'id': self.id,
+                'allow': str(self.allow),
+                'deny': str(self.deny),
+                'type': self.type,
+            }
+        return payload.copy()
+
+_user_types = None
+
+def _is_user(obj):
+    # isinstance against the User ABC has to go through ABCMeta.__instancecheck__,
+    # checking against the classes that implement it directly is much cheaper.
+    # These are resolved lazily since their modules import this one.
+    global _user_types
+    if _user_types is None:
+        from .user import BaseUser
+        from .member import Member
+        _user_types = (Member, BaseUser)
+    return isinstance(obj, _user_types)
+
+_reference_types = None
+
+def _is_reference(obj):
+    # resolved lazily for the same reason as above
+    global _reference_types
+    if _reference_types is None:
+        from .message import Message, PartialMessage, MessageReference
+        _reference_types = (Message, PartialMessage, MessageReference)
+    return isinstance(obj, _reference_types)
+
+def _overwrite_payload(target, overwrite):
+    if not isinstance(overwrite, PermissionOverwrite):
+        raise InvalidArgument('Expected PermissionOverwrite received {0.__name__}'.format(type(overwrite)))
+
+    allow, deny = overwrite.pair()
+    return {
+        'allow': allow.value,
+        'deny': deny.value,
+        'id': target.id,
+        'type': 'role' if isinstance(target, Role) else 'member',
+    }
+
+class _OverriddenRole(Role):
+    # A role with the permission overwrites of a channel applied.
+    # Only the permissions are stored, everything else is looked up
+    # on the wrapped role so there is no need to copy it.
+    __slots__ = ('_role',)
+
+    def __init__(self, role, permissions):
+        self._role = role
+        self._permissions = permissions
+
+    def __getattr__(self, name):
+        if name == '_role':
+            raise AttributeError(name)
+        return getattr(self._role, name)
+
+    def __eq__(self, other):
+        return isinstance(other, Role) and other.id == self.id
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = Role.__hash__
 
 class GuildChannel:
     """An ABC that details the common operations on a Discord guild channel.
@@ -220,22 +344,18 @@ class GuildChannel:
         if position < 0:
             raise InvalidArgument('Channel position cannot be less than 0.')
 
+        if self.guild.get_channel(self.id) is None:
+            # not there somehow lol
+            return
+
         http = self._state.http
         bucket = self._sorting_bucket
-        channels = [c for c in self.guild.channels if c._sorting_bucket == bucket]
-
+        channels = [c for c in self.guild.channels if c._sorting_bucket == bucket and c.id != self.id]
         channels.sort(key=lambda c: c.position)
 
-        try:
-            # remove ourselves from the channel list
-            channels.remove(self)
-        except ValueError:
-            # not there somehow lol
-            return
-        else:
-            index = next((i for i, c in enumerate(channels) if c.position >= position), len(channels))
-            # add ourselves at our designated position
-            channels.insert(index, self)
+        # add ourselves at our designated position
+        index = bisect.bisect_left([c.position for c in channels], position)
+        channels.insert(index, self)
 
         payload = []
         for index, c in enumerate(channels):
@@ -274,40 +394,23 @@ class GuildChannel:
         try:
             position = options.pop('position')
         except KeyError:
-            if parent_id is not _undefined:
-                if lock_permissions:
-                    category = self.guild.get_channel(parent_id)
-                    options['permission_overwrites'] = [c._asdict() for c in category._overwrites]
-                options['parent_id'] = parent_id
-            elif lock_permissions and self.category_id is not None:
+            if lock_permissions:
                 # if we're syncing permissions on a pre-existing channel category without changing it
                 # we need to update the permissions to point to the pre-existing category
-                category = self.guild.get_channel(self.category_id)
-                options['permission_overwrites'] = [c._asdict() for c in category._overwrites]
+                category_id = self.category_id if parent_id is _undefined else parent_id
+                category = self.guild.get_channel(category_id) if category_id is not None else None
+                if category is not None:
+                    options['permission_overwrites'] = [c._asdict() for c in category._overwrites]
+            if parent_id is not _undefined:
+                options['parent_id'] = parent_id
         else:
             await self._move(position, parent_id=parent_id, lock_permissions=lock_permissions, reason=reason)
 
         overwrites = options.get('overwrites', None)
         if overwrites is not None:
-            perms = []
-            for target, perm in overwrites.items():
-                if not isinstance(perm, PermissionOverwrite):
-                    raise InvalidArgument('Expected PermissionOverwrite received {0.__name__}'.format(type(perm)))
-
-                allow, deny = perm.pair()
-                payload = {
-                    'allow': allow.value,
-                    'deny': deny.value,
-                    'id': target.id
-                }
-
-                if isinstance(target, Role):
-                    payload['type'] = 'role'
-                else:
-                    payload['type'] = 'member'
-
-                perms.append(payload)
-            options['permission_overwrites'] = perms
+            options['permission_overwrites'] = [
+                _overwrite_payload(target, perm) for target, perm in overwrites.items()
+            ]
 
         try:
             ch_type = options['type']
@@ -323,32 +426,92 @@ class GuildChannel:
             self._update(self.guild, data)
 
     def _fill_overwrites(self, data):
-        self._overwrites = []
-        everyone_index = 0
+        self._perm_cache = {}
+        try:
+            del self._cs_overwrite_values
+        except AttributeError:
+            pass
+
+        overwrites = data.get('permission_overwrites')
+        if not overwrites:
+            self._raw_overwrites = None
+            self._overwrites = []
+            self._role_ow_index = _EMPTY_INDEX
+            self._role_ow_ids = _EMPTY_IDS
+            self._member_ow_index = _EMPTY_INDEX
+            return
+
+        if self._state.lazy_overwrites:
+            # parsed by __getattr__ once one of the overwrite attributes is needed
+            self._raw_overwrites = overwrites
+            for attr in _LAZY_OVERWRITE_ATTRS:
+                try:
+                    delattr(self, attr)
+                except AttributeError:
+                    pass
+        else:
+            self._raw_overwrites = None
+            self._parse_overwrites(overwrites)
+
+    def __getattr__(self, name):
+        if name in _LAZY_OVERWRITE_ATTRS:
+            overwrites = getattr(self, '_raw_overwrites', None)
+            if overwrites is not None:
+                self._raw_overwrites = None
+                self._parse_overwrites(overwrites)
+                return getattr(self, name)
+
+        raise AttributeError('%r object has no attribute %r' % (self.__class__.__name__, name))
+
+    def _parse_overwrites(self, raw_overwrites):
+        # this must not modify the payload, it may be shared with a copy
+        # of this channel when the overwrites are parsed lazily
+        everyone = None
         everyone_id = self.guild.id
+        overwrites = []
 
-        for index, overridden in enumerate(data.get('permission_overwrites', [])):
-            overridden_type = try_enum(PermissionType, overridden.pop('type'))
+        for overridden in raw_overwrites:
+            overridden_type = try_enum(PermissionType, overridden['type'])
             if not overridden_type:
                 raise AttributeError('Type type should be 0 - member, or 1 - role not %s' % overridden_type)
-            overridden_id = int(overridden.pop('id'))
-            self._overwrites.append(_Overwrites(id=overridden_id, type=overridden_type.name, **overridden))
+            overridden_id = int(overridden['id'])
+            overwrite = _Overwrites(id=overridden_id, type=overridden_type.name,
+                                    allow_new=overridden.get('allow_new', 0),
+                                    deny_new=overridden.get('deny_new', 0))
 
-            if overridden_type.name == 'member':
-                continue
-
-            if overridden_id == everyone_id:
+            if overwrite.type == 'role' and overridden_id == everyone_id:
                 # the @everyone role is not guaranteed to be the first one
                 # in the list of permission overwrites, however the permission
                 # resolution code kind of requires that it is the first one in
-                # the list since it is special. So we need the index so we can
-                # swap it to be the first one.
-                everyone_index = index
+                # the list since it is special. So we keep it aside and put it first.
+                everyone = overwrite
+            else:
+                overwrites.append(overwrite)
+
+        if everyone is not None:
+            overwrites.insert(0, everyone)
+
+        self._overwrites = overwrites
 
-        # do the swap
-        tmp = self._overwrites
-        if tmp:
-            tmp[everyone_index], tmp[0] = tmp[0], tmp[everyone_index]
+        # (allow, deny) pairs by target ID used for permission resolution
+        self._role_ow_index = {o.id: (o.allow, o.deny) for o in overwrites if o.type == 'role' and o is not everyone}
+        self._role_ow_ids = frozenset(self._role_ow_index)
+        self._member_ow_index = {o.id: (o.allow, o.deny) for o in overwrites if o.type == 'member'}
+
+    def _everyone_overwrite(self):
+        # _fill_overwrites moves the @everyone overwrite to the front if there is one
+        overwrites = self._overwrites
+        if overwrites:
+            maybe_everyone = overwrites[0]
+            if maybe_everyone.id == self.guild.id:
+                return maybe_everyone.allow, maybe_everyone.deny
+        return None
+
+    @utils.cached_slot_property('_cs_overwrite_values')
+    def _overwrite_values(self):
+        # the PermissionOverwrite values of each overwrite, in the same order as _overwrites
+        from_pair = PermissionOverwrite.from_pair
+        return [from_pair(Permissions(ow.allow), Permissions(ow.deny))._values for ow in self._overwrites]
 
     @property
     def changed_roles(self):
@@ -356,14 +519,16 @@ class GuildChannel:
         their default values in the :attr:`~discord.Guild.roles` attribute."""
         ret = []
         g = self.guild
-        for overwrite in filter(lambda o: o.type == 'role', self._overwrites):
+        for overwrite in self._overwrites:
+            if overwrite.type != 'role':
+                continue
+
             role = g.get_role(overwrite.id)
             if role is None:
                 continue
 
-            role = copy.copy(role)
-            role.permissions.handle_overwrite(overwrite.allow, overwrite.deny)
-            ret.append(role)
+            permissions = (role._permissions & ~overwrite.deny) | overwrite.allow
+            ret.append(_OverriddenRole(role, permissions))
         return ret
 
     @property
@@ -391,20 +556,26 @@ class GuildChannel:
             The permission overwrites for this object.
         """
 
-        if isinstance(obj, User):
-            predicate = lambda p: p.type == 'member'
-        elif isinstance(obj, Role):
-            predicate = lambda p: p.type == 'role'
+        target_id = obj.id
+        if _is_user(obj):
+            overwrite = self._member_ow_index.get(target_id)
         else:
-            predicate = lambda p: True
+            if target_id == self.guild.id:
+                overwrite = self._everyone_overwrite()
+            else:
+                overwrite = self._role_ow_index.get(target_id)
 
-        for overwrite in filter(predicate, self._overwrites):
-            if overwrite.id == obj.id:
-                allow = Permissions(overwrite.allow)
-                deny = Permissions(overwrite.deny)
-                return PermissionOverwrite.from_pair(allow, deny)
+            if overwrite is None and not isinstance(obj, Role):
+                overwrite = self._member_ow_index.get(target_id)
 
-        return PermissionOverwrite()
+        if overwrite is None:
+            # this has to be a new instance since callers usually modify it
+            # and pass it back to set_permissions
+            return PermissionOverwrite._from_values({})
+
+        allow = Permissions(overwrite[0])
+        deny = Permissions(overwrite[1])
+        return PermissionOverwrite.from_pair(allow, deny)
 
     @property
     def overwrites(self):
@@ -420,15 +591,14 @@ class GuildChannel:
             The channel's permission overwrites.
         """
         ret = {}
-        for ow in self._overwrites:
-            allow = Permissions(ow.allow)
-            deny = Permissions(ow.deny)
-            overwrite = PermissionOverwrite.from_pair(allow, deny)
-
+        from_values = PermissionOverwrite._from_values
+        get_role = self.guild.get_role
+        get_member = self.guild.get_member
+        for ow, values in zip(self._overwrites, self._overwrite_values):
             if ow.type == 'role':
-                target = self.guild.get_role(ow.id)
+                target = get_role(ow.id)
             elif ow.type == 'member':
-                target = self.guild.get_member(ow.id)
+                target = get_member(ow.id)
 
             # TODO: There is potential data loss here in the non-chunked
             # case, i.e. target is None because get_member returned nothing.
@@ -436,7 +606,7 @@ class GuildChannel:
             # i.e. adding discord.Object to the list of it
             # However, for now this is an acceptable compromise.
             if target is not None:
-                ret[target] = overwrite
+                ret[target] = from_values(values.copy())
         return ret
 
     @property
@@ -456,8 +626,14 @@ class GuildChannel:
 
         .. versionadded:: 1.3
         """
-        category = self.guild.get_channel(self.category_id)
-        return bool(category and category.overwrites == self.overwrites)
+        category = self.category
+        if category is None:
+            return False
+
+        # compare the raw overwrites instead of building both overwrites mappings
+        return (category._role_ow_index == self._role_ow_index
+                and category._member_ow_index == self._member_ow_index
+                and category._everyone_overwrite() == self._everyone_overwrite())
 
     def permissions_for(self, member):
         """Handles permission resolution for the current :class:`~discord.Member`.
@@ -497,8 +673,13 @@ class GuildChannel:
         if self.guild.owner_id == member.id:
             return Permissions.all()
 
-        default = self.guild.default_role
-        base = Permissions(default.permissions.value)
+        value = self.guild.default_role._permissions
+
+        # Guild-wide Administrator -> True for everything
+        # Bypass all channel-specific overrides
+        if value & _ADMINISTRATOR:
+            return Permissions.all()
+
         roles = member._roles
         get_role = self.guild.get_role
 
@@ -506,54 +687,30 @@ class GuildChannel:
         for role_id in roles:
             role = get_role(role_id)
             if role is not None:
-                base.value |= role._permissions
+                value |= role._permissions
 
-        # Guild-wide Administrator -> True for everything
-        # Bypass all channel-specific overrides
-        if base.administrator:
+        if value & _ADMINISTRATOR:
             return Permissions.all()
 
-        # Apply @everyone allow/deny first since it's special
+        # From here on the result only depends on the member, the roles they
+        # have and the permissions granted by those roles, so it can be reused
+        # until the overwrites of this channel change.
+        cache = self._perm_cache
+        key = (member.id, roles.tobytes(), value)
         try:
-            maybe_everyone = self._overwrites[0]
-            if maybe_everyone.id == self.guild.id:
-                base.handle_overwrite(allow=maybe_everyone.allow, deny=maybe_everyone.deny)
-                remaining_overwrites = self._overwrites[1:]
-            else:
-                remaining_overwrites = self._overwrites
-        except IndexError:
-            remaining_overwrites = self._overwrites
-
-        denies = 0
-        allows = 0
-
-        # Apply channel specific role permission overwrites
-        for overwrite in remaining_overwrites:
-            if overwrite.type == 'role' and roles.has(overwrite.id):
-                denies |= overwrite.deny
-                allows |= overwrite.allow
-
-        base.handle_overwrite(allow=allows, deny=denies)
-
-        # Apply member specific permission overwrites
-        for overwrite in remaining_overwrites:
-            if overwrite.type == 'member' and overwrite.id == member.id:
-                base.handle_overwrite(allow=overwrite.allow, deny=overwrite.deny)
-                break
-
-        # if you can't send a message in a channel then you can't have certain
-        # permissions as well
-        if not base.send_messages:
-            base.send_tts_messages = False
-            base.mention_everyone = False
-            base.embed_links = False
-            base.attach_files = False
-
-        # if you can't read a channel then you have no permissions there
-        if not base.read_messages:
-            denied = Permissions.all_channel()
-            base.value &= ~denied.value
-        return base
+            return Permissions(cache[key])
+        except KeyError:
+            pass
+
+        everyone = self._everyone_overwrite() or _NO_OVERWRITE
+        member_overwrite = self._member_ow_index.get(member.id, _NO_OVERWRITE)
+        value = _resolve_overwrites(value, everyone, self._role_ow_index, self._role_ow_ids, roles, member_overwrite)
+
+        if len(cache) >= _PERM_CACHE_SIZE:
+            # evict the oldest entry
+            del cache[next(iter(cache))]
+        cache[key] = value
+        return Permissions(value)
 
     async def delete(self, *, reason=None):
         """|coro|
@@ -646,7 +803,7 @@ class GuildChannel:
 
         http = self._state.http
 
-        if isinstance(target, User):
+        if _is_user(target):
             perm_type = 'member'
         elif isinstance(target, Role):
             perm_type = 'role'
@@ -787,60 +944,71 @@ class GuildChannel:
         beginning, end = kwargs.get('beginning'), kwargs.get('end')
         before, after = kwargs.get('before'), kwargs.get('after')
         offset = kwargs.get('offset', 0)
-        if sum(bool(a) for a in (beginning, end, before, after)) > 1:
+        if bool(beginning) + bool(end) + (before is not None) + (after is not None) > 1:
             raise InvalidArgument('Only one of [before, after, end, beginning] can be used.')
 
         bucket = self._sorting_bucket
         parent_id = kwargs.get('category', ...)
-        if parent_id not in (..., None):
-            parent_id = parent_id.id
-            channels = [
-                ch
-                for ch in self.guild.channels
-                if ch._sorting_bucket == bucket
-                and ch.category_id == parent_id
-            ]
+        if parent_id is not ... and parent_id is not None:
+            parent_id = category_id = parent_id.id
         else:
-            channels = [
-                ch
-                for ch in self.guild.channels
-                if ch._sorting_bucket == bucket
-                and ch.category_id == self.category_id
-            ]
-
-        channels.sort(key=lambda c: (c.position, c.id))
-
-        try:
-            # Try to remove ourselves from the channel list
-            channels.remove(self)
-        except ValueError:
-            # If we're not there then it's probably due to not being in the category
-            pass
+            category_id = self.category_id
+
+        guild = self.guild
+        # we leave ourselves out here and slot in at the new position below.
+        # this goes by id since we might be a copy of the cached channel, e.g.
+        # the before argument of on_guild_channel_update.
+        # the guild's mapping is iterated directly rather than a copied list and
+        # category_id is a plain slot that rules out most channels, so it is
+        # tested before the _sorting_bucket property
+        self_id = self.id
+        channels = [
+            ch
+            for ch in guild._channels.values()
+            if ch.category_id == category_id
+            and ch._sorting_bucket == bucket
+            and ch.id != self_id
+        ]
+        channels.sort(key=operator.attrgetter('position', 'id'))
+        indexes = {ch.id: i for i, ch in enumerate(channels)}
 
         index = None
         if beginning:
             index = 0
         elif end:
             index = len(channels)
-        elif before:
-            index = next((i for i, c in enumerate(channels) if c.id == before.id), None)
-        elif after:
-            index = next((i + 1 for i, c in enumerate(channels) if c.id == after.id), None)
+        elif before is not None:
+            index = indexes.get(before.id)
+        elif after is not None:
+            index = indexes.get(after.id)
+            if index is not None:
+                index += 1
 
         if index is None:
             raise InvalidArgument('Could not resolve appropriate move position')
 
-        channels.insert(max((index + offset), 0), self)
-        payload = []
-        lock_permissions = kwargs.get('sync_permissions', False)
+        index = min(max((index + offset), 0), len(channels))
         reason = kwargs.get('reason')
-        for index, channel in enumerate(channels):
-            d = { 'id': channel.id, 'position': index }
-            if parent_id is not ... and channel.id == self.id:
-                d.update(parent_id=parent_id, lock_permissions=lock_permissions)
-            payload.append(d)
+        lock_permissions = kwargs.get('sync_permissions', False)
+        # we are never inserted into the list, every channel from our new index
+        # onwards just moves down by one. channels that already sit at their
+        # new position are left out of the update
+        payload = [
+            {'id': ch.id, 'position': i + (i >= index)}
+            for i, ch in enumerate(channels)
+            if ch.position != i + (i >= index)
+        ]
+        if not payload and self.position == index:
+            if parent_id is ... or (parent_id == self.category_id and not lock_permissions):
+                # nothing would change so don't bother Discord with it
+                return
+
+        entry = {'id': self.id, 'position': index}
+        if parent_id is not ...:
+            entry.update(parent_id=parent_id, lock_permissions=lock_permissions)
+        payload.append(entry)
 
-        await self._state.http.bulk_channel_update(self.guild.id, payload, reason=reason)
+        await self._state.http.bulk_channel_update(guild.id, payload, reason=reason)
 
 
     async def create_invite(self, *, reason=None, **fields):
@@ -908,14 +1076,8 @@ class GuildChannel:
 
         state = self._state
         data = await state.http.invites_from_channel(self.id)
-        result = []
-
-        for invite in data:
-            invite['channel'] = self
-            invite['guild'] = self.guild
-            result.append(Invite(state=state, data=invite))
-
-        return result
+        guild = self.guild
+        return [Invite(state=state, data={**invite, 'channel': self, 'guild': guild}) for invite in data]
 
 class Messageable(metaclass=abc.ABCMeta):
     """An ABC that details the common operations on a model that can send messages.
@@ -1026,15 +1188,15 @@ class Messageable(metaclass=abc.ABCMeta):
 
         channel = await self._get_channel()
         state = self._state
-        content = str(content) if content is not None else None
+        http = state.http
+        if content is not None and type(content) is not str:
+            content = str(content)
 
+        embed_list = [e.to_dict() for e in embeds] if embeds else []
         if embed is not None:
             embed = embed.to_dict()
-        embed_list = []
-        if embed:
-            embed_list.append(embed)
-        if embeds:
-            embed_list.extend([e.to_dict() for e in embeds])
+            if embed:
+                embed_list.insert(0, embed)
         embeds = embed_list
         if len(embeds) > 10:
             raise InvalidArgument(f'The maximum number of embeds that can be send with a message is 10, got: {len(embeds)}')
@@ -1062,10 +1224,9 @@ class Messageable(metaclass=abc.ABCMeta):
             allowed_mentions['replied_user'] = bool(mention_author)
 
         if reference is not None:
-            try:
-                reference = reference.to_message_reference_dict()
-            except AttributeError:
-                raise InvalidArgument('reference parameter must be Message or MessageReference') from None
+            if not _is_reference(reference):
+                raise InvalidArgument('reference parameter must be Message, PartialMessage or MessageReference')
+            reference = reference.to_message_reference_dict()
 
         if file is not None and files is not None:
             raise InvalidArgument('cannot pass both file and files parameter to send()')
@@ -1080,27 +1241,28 @@ class Messageable(metaclass=abc.ABCMeta):
         if is_interaction_response:
             if hidden and file or files:
                 raise AttributeError('An ephemeral(hidden) Message could not contain file(s)')
+        flags = _EPHEMERAL if hidden is True else None
         if file is not None:
             if not isinstance(file, File):
                 raise InvalidArgument('file parameter must be File')
 
             try:
                 if hidden is not None:
-                    data = await state.http.send_interaction_response(use_webhook=use_webhook,
-                                                                      interaction_id=interaction_id,
-                                                                      token=interaction_token,
-                                                                      application_id=application_id,
-                                                                      deferred=deferred,
-                                                                      files=[file], allowed_mentions=allowed_mentions,
-                                                                      content=content, tts=tts, embeds=embeds,
-                                                                      components=components,
-                                                                      nonce=nonce, message_reference=reference,
-                                                                      flags=64 if hidden is True else None,
-                                                                      followup=followup)
+                    data = await http.send_interaction_response(use_webhook=use_webhook,
+                                                                interaction_id=interaction_id,
+                                                                token=interaction_token,
+                                                                application_id=application_id,
+                                                                deferred=deferred,
+                                                                files=[file], allowed_mentions=allowed_mentions,
+                                                                content=content, tts=tts, embeds=embeds,
+                                                                components=components,
+                                                                nonce=nonce, message_reference=reference,
+                                                                flags=flags,
+                                                                followup=followup)
                 else:
-                    data = await state.http.send_files(channel.id, files=[file], allowed_mentions=allowed_mentions,
-                                                       content=content, tts=tts, embeds=embeds, components=components,
-                                                       nonce=nonce, message_reference=reference)
+                    data = await http.send_files(channel.id, files=[file], allowed_mentions=allowed_mentions,
+                                                 content=content, tts=tts, embeds=embeds, components=components,
+                                                 nonce=nonce, message_reference=reference)
             finally:
                 file.close()
 
@@ -1112,46 +1274,46 @@ class Messageable(metaclass=abc.ABCMeta):
 
             try:
                 if hidden is not None:
-                    data = await state.http.send_interaction_response(use_webhook=use_webhook,
-                                                                      interaction_id=interaction_id,
-                                                                      token=interaction_token,
-                                                                      application_id=application_id,
-                                                                      deferred=deferred,
-                                                                      files=file, allowed_mentions=allowed_mentions,
-                                                                      content=content, tts=tts, embeds=embeds,
-                                                                      components=components,
-                                                                      nonce=nonce, message_reference=reference,
-                                                                      flags=64 if hidden is True else None,
-                                                                      followup=followup or deferred)
+                    data = await http.send_interaction_response(use_webhook=use_webhook,
+                                                                interaction_id=interaction_id,
+                                                                token=interaction_token,
+                                                                application_id=application_id,
+                                                                deferred=deferred,
+                                                                files=file, allowed_mentions=allowed_mentions,
+                                                                content=content, tts=tts, embeds=embeds,
+                                                                components=components,
+                                                                nonce=nonce, message_reference=reference,
+                                                                flags=flags,
+                                                                followup=followup or deferred)
                 else:
-                    data = await state.http.send_files(channel.id, files=files, content=content, tts=tts,
-                                                       embeds=embeds, components=components, nonce=nonce,
-                                                       allowed_mentions=allowed_mentions, message_reference=reference)
+                    data = await http.send_files(channel.id, files=files, content=content, tts=tts,
+                                                 embeds=embeds, components=components, nonce=nonce,
+                                                 allowed_mentions=allowed_mentions, message_reference=reference)
             finally:
                 for f in files:
                     f.close()
         else:
             if hidden is not None:
-                data = await state.http.send_interaction_response(use_webhook=use_webhook,
-                                                                  interaction_id=interaction_id,
-                                                                  token=interaction_token,
-                                                                  application_id=application_id,
-                                                                  deferred=deferred, allowed_mentions=allowed_mentions,
-                                                                  content=content, tts=tts, embeds=embeds,
-                                                                  components=components,
-                                                                  nonce=nonce, message_reference=reference,
-                                                                  flags=64 if hidden is True else None,
-                                                                  followup=followup)
+                data = await http.send_interaction_response(use_webhook=use_webhook,
+                                                            interaction_id=interaction_id,
+                                                            token=interaction_token,
+                                                            application_id=application_id,
+                                                            deferred=deferred, allowed_mentions=allowed_mentions,
+                                                            content=content, tts=tts, embeds=embeds,
+                                                            components=components,
+                                                            nonce=nonce, message_reference=reference,
+                                                            flags=flags,
+                                                            followup=followup)
             else:
-                data = await state.http.send_message(channel.id, content, tts=tts, embeds=embeds, components=components,
-                                                                          nonce=nonce, allowed_mentions=allowed_mentions,
-                                                                          message_reference=reference)
+                data = await http.send_message(channel.id, content, tts=tts, embeds=embeds, components=components,
+                                                                    nonce=nonce, allowed_mentions=allowed_mentions,
+                                                                    message_reference=reference)
         if not hidden is True:
             if not isinstance(data, dict) and not hidden is None:
                 """Thanks Discord that they dont return the message when we send the interaction callback"""
-                data = await state.http.get_original_interaction_response(application_id=application_id, interaction_token=interaction_token)
+                data = await http.get_original_interaction_response(application_id=application_id, interaction_token=interaction_token)
             ret = state.create_message(channel=channel, data=data)
-            if (delete_after is not None) and (not hidden is True):
+            if delete_after is not None:
                 await ret.delete(delay=delete_after)
             return ret
 
@@ -1243,7 +1405,7 @@ class Messageable(metaclass=abc.ABCMeta):
         data = await state.http.pins_from(channel.id)
         return [state.create_message(channel=channel, data=m) for m in data]
 
-    def history(self, *, limit=100, before=None, after=None, around=None, oldest_first=None):
+    def history(self, *, limit=100, before=None, after=None, around=None, oldest_first=None, prefetch=False):
         """Returns an :class:`~discord.AsyncIterator` that enables receiving the destination's message history.
 
         You must have :attr:`~Permissions.read_message_history` permissions to use this.
@@ -1285,6 +1447,10 @@ class Messageable(metaclass=abc.ABCMeta):
         oldest_first: Optional[:class:`bool`]
             If set to ``True``, return messages in oldest->newest order. Defaults to ``True`` if
             ``after`` is specified, otherwise ``False``.
+        prefetch: :class:`bool`
+            If set to ``True``, the next page of messages is requested in the background while
+            the current one is being iterated over. This hides most of the request latency
+            when retrieving more than 100 messages. Defaults to ``False``.
 
         Raises
         ------
@@ -1298,7 +1464,8 @@ class Messageable(metaclass=abc.ABCMeta):
         :class:`~discord.Message`
             The message with the message data parsed.
         """
-        return HistoryIterator(self, limit=limit, before=before, after=after, around=around, oldest_first=oldest_first)
+        return HistoryIterator(self, limit=limit, before=before, after=after, around=around, oldest_first=oldest_first,
+                               prefetch=prefetch)
 
 class Connectable(metaclass=abc.ABCMeta):
     """An ABC that details the common operations on a channel that can
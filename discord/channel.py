@@ -118,7 +118,8 @@ class TextChannel(discord.abc.Messageable, discord.abc.GuildChannel, Hashable):
 
     __slots__ = ('name', 'id', 'guild', 'topic', '_state', 'nsfw',
                  'category_id', 'position', 'slowmode_delay', '_overwrites',
-                 '_type', 'last_message_id')
+                 '_raw_overwrites', '_role_ow_index', '_role_ow_ids', '_member_ow_index',
+                 '_perm_cache', '_cs_overwrite_values', '_type', 'last_message_id')
 
     def __init__(self, *, state, guild, data):
         self._state = state
@@ -560,8 +561,9 @@ class TextChannel(discord.abc.Messageable, discord.abc.GuildChannel, Hashable):
 
 class VocalGuildChannel(discord.abc.Connectable, discord.abc.GuildChannel, Hashable):
     __slots__ = ('name', 'id', 'guild', 'bitrate', 'user_limit',
-                 '_state', 'position', '_overwrites', 'category_id',
-                 'rtc_region')
+                 '_state', 'position', '_overwrites', '_raw_overwrites',
+                 '_role_ow_index', '_role_ow_ids', '_member_ow_index', '_perm_cache',
+                 '_cs_overwrite_values', 'category_id', 'rtc_region')
 
     def __init__(self, *, state, guild, data):
         self._state = state
@@ -912,7 +914,9 @@ class CategoryChannel(discord.abc.GuildChannel, Hashable):
         top category is position 0.
     """
 
-    __slots__ = ('name', 'id', 'guild', 'nsfw', '_state', 'position', '_overwrites', 'category_id')
+    __slots__ = ('name', 'id', 'guild', 'nsfw', '_state', 'position', '_overwrites',
+                 '_raw_overwrites', '_role_ow_index', '_role_ow_ids', '_member_ow_index',
+                 '_perm_cache', '_cs_overwrite_values', 'category_id')
 
     def __init__(self, *, state, guild, data):
         self._state = state
@@ -1108,7 +1112,9 @@ class StoreChannel(discord.abc.GuildChannel, Hashable):
         top channel is position 0.
     """
     __slots__ = ('name', 'id', 'guild', '_state', 'nsfw',
-                 'category_id', 'position', '_overwrites',)
+                 'category_id', 'position', '_overwrites', '_raw_overwrites',
+                 '_role_ow_index', '_role_ow_ids', '_member_ow_index', '_perm_cache',
+                 '_cs_overwrite_values')
 
     def __init__(self, *, state, guild, data):
         self._state = state
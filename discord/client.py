@@ -208,6 +208,11 @@ class Client:
 
             In short, this makes it so the only member you can reliably query is the
             message author. Useful for bots that do not require any state.
+    lazy_overwrites: :class:`bool`
+        Whether to defer parsing the permission overwrites of guild channels until
+        they are first needed, e.g. by :meth:`abc.GuildChannel.permissions_for`.
+        This reduces the work done while receiving guilds for bots that only
+        check permissions in a few channels. Defaults to ``False``.
     assume_unsync_clock: :class:`bool`
         Whether to assume the system clock is unsynced. This applies to the ratelimit handling
         code. If this is set to ``True``, the default, then the library uses the time to reset
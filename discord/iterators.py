@@ -34,6 +34,12 @@ from .audit_logs import AuditLogEntry
 
 OLDEST_OBJECT = Object(id=0)
 
+def _consume_exception(task):
+    # a prefetched page can be abandoned, retrieve its exception so
+    # asyncio doesn't complain that it never was
+    if not task.cancelled():
+        task.exception()
+
 class _AsyncIterator:
     __slots__ = ()
 
@@ -226,10 +232,13 @@ class HistoryIterator(_AsyncIterator):
     oldest_first: Optional[:class:`bool`]
         If set to ``True``, return messages in oldest->newest order. Defaults to
         ``True`` if `after` is specified, otherwise ``False``.
+    prefetch: :class:`bool`
+        If set to ``True``, request the next page of messages in the background
+        while the current one is being consumed.
     """
 
     def __init__(self, messageable, limit,
-                 before=None, after=None, around=None, oldest_first=None):
+                 before=None, after=None, around=None, oldest_first=None, prefetch=False):
 
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -251,6 +260,9 @@ class HistoryIterator(_AsyncIterator):
 
         self._filter = None  # message dict -> bool
 
+        self.prefetch = prefetch
+        self._prefetch_task = None
+
         self.state = self.messageable._state
         self.logs_from = self.state.http.logs_from
         self.messages = asyncio.Queue()
@@ -263,22 +275,36 @@ class HistoryIterator(_AsyncIterator):
             elif self.limit == 101:
                 self.limit = 100  # Thanks discord
 
-            self._retrieve_messages = self._retrieve_messages_around_strategy
+            self._strategy = 'around'
+            # the filters capture the ids rather than self so that the iterator
+            # isn't part of a reference cycle, see __del__
             if self.before and self.after:
-                self._filter = lambda m: self.after.id < int(m['id']) < self.before.id
+                after_id, before_id = self.after.id, self.before.id
+                self._filter = lambda m: after_id < int(m['id']) < before_id
             elif self.before:
-                self._filter = lambda m: int(m['id']) < self.before.id
+                before_id = self.before.id
+                self._filter = lambda m: int(m['id']) < before_id
             elif self.after:
-                self._filter = lambda m: self.after.id < int(m['id'])
+                after_id = self.after.id
+                self._filter = lambda m: after_id < int(m['id'])
         else:
             if self.reverse:
-                self._retrieve_messages = self._retrieve_messages_after_strategy
+                self._strategy = 'after'
                 if (self.before):
-                    self._filter = lambda m: int(m['id']) < self.before.id
+                    before_id = self.before.id
+                    self._filter = lambda m: int(m['id']) < before_id
             else:
-                self._retrieve_messages = self._retrieve_messages_before_strategy
+                self._strategy = 'before'
                 if (self.after and self.after != OLDEST_OBJECT):
-                    self._filter = lambda m: int(m['id']) > self.after.id
+                    after_id = self.after.id
+                    self._filter = lambda m: int(m['id']) > after_id
+
+    def __del__(self):
+        # cancel a prefetched page nobody is going to read anymore, e.g. after
+        # breaking out of an async for loop
+        task = getattr(self, '_prefetch_task', None)
+        if task is not None and not task.done() and not self.state.loop.is_closed():
+            task.cancel()
 
     async def next(self):
         if self.messages.empty():
@@ -304,10 +330,10 @@ class HistoryIterator(_AsyncIterator):
         result = []
         channel = await self.messageable._get_channel()
         self.channel = channel
-        while self._get_retrieve():
-            data = await self._retrieve_messages(self.retrieve)
-            if len(data) < 100:
-                self.limit = 0 # terminate the infinite loop
+        while True:
+            data = await self._fetch_page()
+            if data is None:
+                break
 
             if self.reverse:
                 data = reversed(data)
@@ -324,11 +350,8 @@ class HistoryIterator(_AsyncIterator):
             channel = await self.messageable._get_channel()
             self.channel = channel
 
-        if self._get_retrieve():
-            data = await self._retrieve_messages(self.retrieve)
-            if len(data) < 100:
-                self.limit = 0 # terminate the infinite loop
-
+        data = await self._fetch_page()
+        if data is not None:
             if self.reverse:
                 data = reversed(data)
             if self._filter:
@@ -338,38 +361,65 @@ class HistoryIterator(_AsyncIterator):
             for element in data:
                 await self.messages.put(self.state.create_message(channel=channel, data=element))
 
+    async def _fetch_page(self):
+        # returns the next page of raw messages or None if there are no more
+        task = self._prefetch_task
+        if task is not None:
+            self._prefetch_task = None
+            data = await task
+            self._store_messages(data, self.retrieve)
+        elif self._get_retrieve():
+            data = await self._retrieve_messages(self.retrieve)
+        else:
+            return None
+
+        if len(data) < 100:
+            self.limit = 0 # terminate the infinite loop
+
+        if self.prefetch and self._get_retrieve():
+            # the next request depends on the cursor moved by this page,
+            # so only one request is ever in flight
+            request = self._request_messages(self.retrieve)
+            if request is not None:
+                task = asyncio.ensure_future(request, loop=self.state.loop)
+                task.add_done_callback(_consume_exception)
+                self._prefetch_task = task
+        return data
+
     async def _retrieve_messages(self, retrieve):
         """Retrieve messages and update next parameters."""
-        pass
-
-    async def _retrieve_messages_before_strategy(self, retrieve):
-        """Retrieve messages using before parameter."""
-        before = self.before.id if self.before else None
-        data = await self.logs_from(self.channel.id, retrieve, before=before)
-        if len(data):
-            if self.limit is not None:
-                self.limit -= retrieve
-            self.before = Object(id=int(data[-1]['id']))
+        request = self._request_messages(retrieve)
+        data = [] if request is None else await request
+        self._store_messages(data, retrieve)
         return data
 
-    async def _retrieve_messages_after_strategy(self, retrieve):
-        """Retrieve messages using after parameter."""
-        after = self.after.id if self.after else None
-        data = await self.logs_from(self.channel.id, retrieve, after=after)
-        if len(data):
+    def _request_messages(self, retrieve):
+        """Request the next page using the before, after or around parameter."""
+        # only the HTTP call is returned so that a prefetched request
+        # doesn't keep the iterator alive
+        strategy = self._strategy
+        if strategy == 'before':
+            before = self.before.id if self.before else None
+            return self.logs_from(self.channel.id, retrieve, before=before)
+        elif strategy == 'after':
+            after = self.after.id if self.after else None
+            return self.logs_from(self.channel.id, retrieve, after=after)
+        elif self.around:
+            return self.logs_from(self.channel.id, retrieve, around=self.around.id)
+        return None
+
+    def _store_messages(self, data, retrieve):
+        """Update next parameters from a retrieved page."""
+        strategy = self._strategy
+        if strategy == 'around':
+            self.around = None
+        elif len(data):
             if self.limit is not None:
                 self.limit -= retrieve
-            self.after = Object(id=int(data[0]['id']))
-        return data
-
-    async def _retrieve_messages_around_strategy(self, retrieve):
-        """Retrieve messages using around parameter."""
-        if self.around:
-            around = self.around.id if self.around else None
-            data = await self.logs_from(self.channel.id, retrieve, around=around)
-            self.around = None
-            return data
-        return []
+            if strategy == 'before':
+                self.before = Object(id=int(data[-1]['id']))
+            else:
+                self.after = Object(id=int(data[0]['id']))
 
 class AuditLogIterator(_AsyncIterator):
     def __init__(self, guild, limit=None, before=None, after=None, oldest_first=None, user_id=None, action_type=None):
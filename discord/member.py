@@ -295,7 +295,9 @@ class Member(discord.abc.Messageable, _BaseUser):
         return self
 
     async def _get_channel(self):
-        ch = await self.create_dm()
+        ch = self.dm_channel
+        if ch is None:
+            ch = await self.create_dm()
         return ch
 
     def _update_roles(self, data):
@@ -569,6 +569,14 @@ class PermissionOverwrite:
 
         return allow, deny
 
+    @classmethod
+    def _from_values(cls, values):
+        # skips the keyword argument validation of __init__,
+        # values must already be a valid mapping of permission name to bool
+        self = cls.__new__(cls)
+        self._values = values
+        return self
+
     @classmethod
     def from_pair(cls, allow, deny):
         """Creates an overwrite from an allow/deny pair of :class:`Permissions`."""
@@ -132,6 +132,7 @@ class ConnectionState:
             raise ValueError('guild_ready_timeout cannot be negative')
 
         self.guild_subscriptions = options.get('guild_subscriptions', True)
+        self.lazy_overwrites = options.get('lazy_overwrites', False)
         allowed_mentions = options.get('allowed_mentions')
 
         if allowed_mentions is not None and not isinstance(allowed_mentions, AllowedMentions):
@@ -63,6 +63,10 @@ class _PartialTemplateState:
     def member_cache_flags(self):
         return self.__state.member_cache_flags
 
+    @property
+    def lazy_overwrites(self):
+        return self.__state.lazy_overwrites
+
     def store_emoji(self, guild, packet):
         return None
 
@@ -719,7 +719,9 @@ class User(BaseUser, discord.abc.Messageable):
         return '<User id={0.id} name={0.name!r} discriminator={0.discriminator!r} bot={0.bot}>'.format(self)
 
     async def _get_channel(self):
-        ch = await self.create_dm()
+        ch = self.dm_channel
+        if ch is None:
+            ch = await self.create_dm()
         return ch
 
     @property